@@ -52,29 +52,46 @@
         - Turn years-of-interest into constants
 """
 
+from concurrent.futures import ThreadPoolExecutor
 import os
 
 from IPython.display import display
 import pandas as pd
-import requests
 import seaborn as sns
 
 import utils
 
+# Copy-on-write means boolean-mask cuts can be taken without defensive .copy() calls: pandas only copies the data lazily, if and when a cut is actually written to
+pd.set_option("mode.copy_on_write", True)
+
+# Apply the plot theme once at import time rather than before individual plots: sns.set_theme rebuilds matplotlib's style dictionaries on every call
+sns.set_theme(style="whitegrid")
+
 # %%
 # SET CONSTANTS
+# os.getlogin() can shell out on some platforms, so resolve it once rather than per path option
+USER_NAME = os.getlogin()
 CSPS_PATH_OPTIONS = [
-    "C:/Users/" + os.getlogin() + "/Institute for Government/Data - General/Civil service/Civil Service - People Survey/",
-    "C:/Users/" + os.getlogin() + "/OneDrive - Institute for Government/Data - Civil service/Civil Service - People Survey/"
+    "C:/Users/" + USER_NAME + "/Institute for Government/Data - General/Civil service/Civil Service - People Survey/",
+    "C:/Users/" + USER_NAME + "/OneDrive - Institute for Government/Data - Civil service/Civil Service - People Survey/"
 ]
 CSPS_FILE_NAME = "Organisation working file.xlsx"
 CSPS_SHEET = "Data.Collated"
+# Resolve the data paths once at module level with cheap os.path.exists probes, rather than exception-driven read attempts at load time
+CSPS_PATH = utils.resolve_data_path(CSPS_PATH_OPTIONS, CSPS_FILE_NAME)
+CSPS_XLSX_PATH = CSPS_PATH + CSPS_FILE_NAME
+CSPS_USECOLS = ["Year", "Departmental group", "Organisation", "Organisation type", "Section", "Label", "Value"]
+CSPS_CATEGORY_COLUMNS = ["Organisation", "Organisation type", "Departmental group", "Section", "Label"]
 PAY_PATH_OPTIONS = [
-    "C:/Users/" + os.getlogin() + "/Institute for Government/Data - General/Civil service/Civil Service - pay and high pay/",
-    "C:/Users/" + os.getlogin() + "/OneDrive - Institute for Government/Data - Civil service/Civil Service - pay and high pay/"
+    "C:/Users/" + USER_NAME + "/Institute for Government/Data - General/Civil service/Civil Service - pay and high pay/",
+    "C:/Users/" + USER_NAME + "/OneDrive - Institute for Government/Data - Civil service/Civil Service - pay and high pay/"
 ]
 PAY_FILE_NAME = "Pay working file.xlsx"
 PAY_SHEET = "Collated.Organisation x grade"
+PAY_PATH = utils.resolve_data_path(PAY_PATH_OPTIONS, PAY_FILE_NAME)
+PAY_XLSX_PATH = PAY_PATH + PAY_FILE_NAME
+PAY_USECOLS = ["Year", "Departmental group", "Organisation", "Organisation type", "Grade", "Median salary"]
+PAY_CATEGORY_COLUMNS = ["Organisation", "Organisation type", "Departmental group", "Grade"]
 PAY_NA_VALUES = ["[c]", "[n]", "-", ".."]
 CPI_API_URL = "https://api.beta.ons.gov.uk/v1/data?uri=/economy/inflationandpriceindices/timeseries/d7bt/mm23"
 CPI_DEFLATOR_MIN_YEAR = 2010
@@ -124,16 +141,16 @@ PAY_MEASURE_COLUMN = "Median salary"
 
 # NB: 'Organisations' that are dropped across all the organisation-level analysis - mean and median civil service figures - are intentionally not included here
 CSPS_ORGANISATION_ONLY_CONDITIONS = {
-    "exclude_orgs": [
+    "exclude_orgs": frozenset({
         "Scotland, Wales and Northern Ireland Offices, and the Office of the Advocate General for Scotland",
         "HM Prison and Probation Service (excluding HM Prison Service and National Probation Service/Probation Service)",
         "HM Prison Service",
         "Probation Service",
         "HM Inspectorate of Constabulary and Fire and Rescue Services",
-    ],
+    }),
 }
 PAY_ORGANISATION_ONLY_CONDITIONS = {
-    "exclude_orgs": [
+    "exclude_orgs": frozenset({
         "Office of the Secretary of State for Scotland",
         "Office of the Secretary of State for Wales",
         "Northern Ireland Office",
@@ -149,33 +166,40 @@ PAY_ORGANISATION_ONLY_CONDITIONS = {
         "Education and Skills Funding Agency",
         "Standards and Testing Agency",
         "Teaching Regulation Agency",
-    ],
+    }),
 }
 CSPS_DEPT_ONLY_CONDITIONS = {
     "organisation_type_filter": ["Ministerial department"],
-    "exclude_orgs": [
+    "exclude_orgs": frozenset({
         "Attorney General's Office",
         "Export Credits Guarantee Department"
-    ],
-    "include_orgs": [
+    }),
+    "include_orgs": frozenset({
         "Department for Education group (including agencies)",
         "HM Revenue and Customs",
-    ],
+    }),
 }
 PAY_DEPT_ONLY_CONDITIONS = {
     "organisation_type_filter": ["Ministerial department"],
-    "exclude_orgs": [
+    "exclude_orgs": frozenset({
         "Attorney General's Office",
         "Export Credits Guarantee Department",
         "Office of the Secretary of State for Scotland",
         "Office of the Secretary of State for Wales",
         "Northern Ireland Office",
-    ],
-    "include_orgs": [
+    }),
+    "include_orgs": frozenset({
         "HM Revenue and Customs",
-    ]
+    })
 }
 
+# Combined exclusion sets, precomputed once rather than rebuilt at each call site: frozensets feed straight into .isin and make clear which call sites share the same exclusions
+CSPS_SUMMARY_ORGS = frozenset({CSPS_MEDIAN_ORGANISATION_NAME, CSPS_MEAN_ORGANISATION_NAME})
+CSPS_ORGANISATION_EXCLUDE_ORGS = CSPS_SUMMARY_ORGS | CSPS_ORGANISATION_ONLY_CONDITIONS["exclude_orgs"]
+CSPS_DEPT_EXCLUDE_ORGS = CSPS_DEPT_ONLY_CONDITIONS["exclude_orgs"]
+PAY_ORGANISATION_EXCLUDE_ORGS = PAY_ORGANISATION_ONLY_CONDITIONS["exclude_orgs"]
+PAY_DEPT_EXCLUDE_ORGS = PAY_DEPT_ONLY_CONDITIONS["exclude_orgs"]
+
 CSPS_ORGANISATION_RENAMINGS = {
     "Ministry of Housing, Communities & Local Government - 2024 iteration": "Ministry of Housing, Communities & Local Government",
     "Department for Education group (including agencies)": "Department for Education/Department for Education group",
@@ -188,49 +212,47 @@ PAY_ORGANISATION_RENAMINGS = {
 
 # %%
 # LOAD DATA
-# Try to load from each path option until one works
-for path in CSPS_PATH_OPTIONS:
-    try:
-        df_csps = pd.read_excel(path + CSPS_FILE_NAME, sheet_name=CSPS_SHEET)
-        print(f"Loaded data from {path}")
-        break
-    except FileNotFoundError:
-        print(f"File not found in {path}, trying next option...")
-
-for path in PAY_PATH_OPTIONS:
-    try:
-        df_pay = pd.read_excel(path + PAY_FILE_NAME, sheet_name=PAY_SHEET, na_values=PAY_NA_VALUES)
-        print(f"Loaded pay data from {path}")
-        break
-    except FileNotFoundError:
-        print(f"File not found in {path}, trying next option...")
+# NB: The repeated string columns are converted to categoricals as part of the load: this shrinks the frames and the cache files considerably and makes downstream filters and merges integer comparisons rather than string comparisons
+# NB: The two workbooks are independent and parsing is I/O and C-extension bound (calamine releases the GIL), so they are loaded concurrently on a small thread pool. The futures are only resolved after the CPI fetch below, so workbook parsing also overlaps with the network round-trip and the CPI frame construction on the main thread
+executor = ThreadPoolExecutor(max_workers=2)
+future_csps = executor.submit(
+    utils.load_excel_with_cache, CSPS_PATH, CSPS_FILE_NAME, CSPS_SHEET,
+    usecols=CSPS_USECOLS, dtype={"Year": "int16"}, category_columns=CSPS_CATEGORY_COLUMNS
+)
+future_pay = executor.submit(
+    utils.load_excel_with_cache, PAY_PATH, PAY_FILE_NAME, PAY_SHEET,
+    na_values=PAY_NA_VALUES, usecols=PAY_USECOLS, dtype={"Year": "int16"}, category_columns=PAY_CATEGORY_COLUMNS
+)
 
 # Load CPI data from ONS API
+# NB: The response is cached on disk for a day, as the series changes at most monthly
 print("Fetching CPI data from ONS API...")
-response = requests.get(CPI_API_URL)
-response.raise_for_status()
-cpi_data = response.json()
+cpi_data = utils.fetch_json_with_cache(CPI_API_URL, "ons_cpi")
 
 # Extract monthly observations from API response
 months = cpi_data.get('months', [])
 
-# Convert to DataFrame
-df_cpi = pd.DataFrame(months)
-
-# Filter for April records between the min and max years
-df_cpi = df_cpi[
-    (df_cpi['month'] == CPI_DEFLATOR_MONTH) &
-    (df_cpi['year'].astype(int) >= CPI_DEFLATOR_MIN_YEAR) &
-    (df_cpi['year'].astype(int) <= CPI_DEFLATOR_MAX_YEAR)
-].copy()
+# Filter for April records between the min and max years before constructing the DataFrame, so columns are only built for the ~16 records we keep rather than the full monthly series
+april_months = [
+    month for month in months
+    if month['month'] == CPI_DEFLATOR_MONTH and CPI_DEFLATOR_MIN_YEAR <= int(month['year']) <= CPI_DEFLATOR_MAX_YEAR
+]
 
-# Extract year and CPI value
-df_cpi['Year'] = df_cpi['year'].astype(int)
+# Convert to DataFrame and extract year and CPI value
+df_cpi = pd.DataFrame(april_months)
+df_cpi['Year'] = df_cpi['year'].astype("int16")
 df_cpi['CPI'] = df_cpi['value'].astype(float)
 df_cpi = df_cpi[['Year', 'CPI']]
 
 print(f"Loaded CPI data from ONS API ({len(df_cpi)} records)")
 
+df_csps = future_csps.result()
+df_pay = future_pay.result()
+executor.shutdown()
+
+print(f"Loaded data from {CSPS_PATH}")
+print(f"Loaded pay data from {PAY_PATH}")
+
 # %%
 # RUN CHECKS ON DATA
 utils.check_csps_data(
@@ -260,194 +282,211 @@ utils.check_csstats_data(
 # %%
 # EDIT DATA
 # Filter data
-df_csps_eei_ts = utils.edit_csps_data(
-    df=df_csps,
-    dept_groups_to_drop=DEPT_GROUPS_TO_DROP,
-    orgs_to_drop=CSPS_ORGS_TO_DROP,
-    min_year=CSPS_MIN_YEAR,
-    max_year=CSPS_MAX_YEAR
-)
-
-df_pay_cleaned = utils.edit_csstats_data(
-    df=df_pay,
-    target_grade_name=PAY_TARGET_GRADE_NAME,
-    dept_groups_to_drop=DEPT_GROUPS_TO_DROP,
-    measure_column=PAY_MEASURE_COLUMN,
-    min_year=PAY_MIN_YEAR,
-    max_year=PAY_MAX_YEAR
-)
+# NB: The cleaned frames are memoised to disk, keyed on the source workbook mtimes and the constants the cleaning depends on, so re-runs skip the cleaning when nothing has changed
+df_csps_eei_ts = utils.cache_stage(
+    "csps_eei_ts",
+    (os.path.getmtime(CSPS_XLSX_PATH), tuple(DEPT_GROUPS_TO_DROP), tuple(CSPS_ORGS_TO_DROP), CSPS_MIN_YEAR, CSPS_MAX_YEAR),
+    lambda: utils.edit_csps_data(
+        df=df_csps,
+        dept_groups_to_drop=DEPT_GROUPS_TO_DROP,
+        orgs_to_drop=CSPS_ORGS_TO_DROP,
+        min_year=CSPS_MIN_YEAR,
+        max_year=CSPS_MAX_YEAR
+    )
+)
+
+df_pay_cleaned = utils.cache_stage(
+    "pay_cleaned",
+    (os.path.getmtime(PAY_XLSX_PATH), tuple(DEPT_GROUPS_TO_DROP), PAY_TARGET_GRADE_NAME, PAY_MEASURE_COLUMN, PAY_MIN_YEAR, PAY_MAX_YEAR),
+    lambda: utils.edit_csstats_data(
+        df=df_pay,
+        target_grade_name=PAY_TARGET_GRADE_NAME,
+        dept_groups_to_drop=DEPT_GROUPS_TO_DROP,
+        measure_column=PAY_MEASURE_COLUMN,
+        min_year=PAY_MIN_YEAR,
+        max_year=PAY_MAX_YEAR
+    )
+)
+
+# Sort the cleaned pay data on the keys the cuts and joins below use, so each cut selects contiguous runs of rows rather than a scattered gather
+df_pay_cleaned = df_pay_cleaned.sort_values(["Organisation", "Year"], ignore_index=True)
+
+# float32 is ample precision for salary medians and halves the numeric bytes carried through every cut, join and regression below
+df_pay_cleaned["Median salary"] = df_pay_cleaned["Median salary"].astype("float32")
 
 # %%
 # Create cuts of the CSPS data we'll need (CS median x all years, organisation-level x 2024, department-level x 2024, organisation-level x all years, department-level x all years) and convert to wide format
-df_csps_eei_ts_median_pivot = utils.filter_pivot_data(
-    df_csps_eei_ts,
-    organisation_filter=CSPS_MEDIAN_ORGANISATION_NAME,
-)
+# NB: The long frame is pivoted once at the widest scope and each cut is sliced from the result, rather than re-filtering and re-pivoting the long frame per cut
+# The wide pivot is also memoised to disk, so re-running this cell (or the whole file in a fresh kernel) skips the pivot when the inputs are unchanged
+df_csps_eei_ts_pivot = utils.cache_stage(
+    "csps_eei_ts_pivot",
+    (os.path.getmtime(CSPS_XLSX_PATH), tuple(DEPT_GROUPS_TO_DROP), tuple(CSPS_ORGS_TO_DROP), CSPS_MIN_YEAR, CSPS_MAX_YEAR),
+    lambda: utils.filter_pivot_data(
+        df_csps_eei_ts,
+        preserve_columns=["Organisation type"]
+    )
+)
+
+df_csps_eei_ts_median_pivot = df_csps_eei_ts_pivot.loc[
+    df_csps_eei_ts_pivot["Organisation"] == CSPS_MEDIAN_ORGANISATION_NAME
+].drop(columns=["Organisation", "Organisation type"]).reset_index(drop=True)
+
+df_csps_eei_ts_organisation_pivot = df_csps_eei_ts_pivot.loc[
+    ~df_csps_eei_ts_pivot["Organisation"].isin(CSPS_ORGANISATION_EXCLUDE_ORGS)
+].reset_index(drop=True)
+
+df_csps_eei_ts_organisation2024_pivot = df_csps_eei_ts_organisation_pivot.loc[
+    df_csps_eei_ts_organisation_pivot["Year"] == 2024
+].drop(columns=["Year"]).reset_index(drop=True)
+
+# The department-level pivots are strict subsets of the organisation-level pivots, so derive them from those rather than re-filtering and re-pivoting df_csps_eei_ts
+# NB: The organisations dropped from the organisation-level analysis that are not dropped from the department-level analysis are all excluded by the organisation type filter anyway, so the two routes give the same rows
+is_csps_dept_2024 = (
+    (df_csps_eei_ts_organisation2024_pivot["Organisation type"].isin(CSPS_DEPT_ONLY_CONDITIONS["organisation_type_filter"])) |
+    (df_csps_eei_ts_organisation2024_pivot["Organisation"].isin(CSPS_DEPT_ONLY_CONDITIONS["include_orgs"]))
+) & (
+    ~df_csps_eei_ts_organisation2024_pivot["Organisation"].isin(CSPS_DEPT_EXCLUDE_ORGS)
+)
+df_csps_eei_ts_dept2024_pivot = df_csps_eei_ts_organisation2024_pivot.loc[is_csps_dept_2024]
+
+is_csps_dept = (
+    (df_csps_eei_ts_organisation_pivot["Organisation type"].isin(CSPS_DEPT_ONLY_CONDITIONS["organisation_type_filter"])) |
+    (df_csps_eei_ts_organisation_pivot["Organisation"].isin(CSPS_DEPT_ONLY_CONDITIONS["include_orgs"]))
+) & (
+    ~df_csps_eei_ts_organisation_pivot["Organisation"].isin(CSPS_DEPT_EXCLUDE_ORGS)
+)
+df_csps_eei_ts_dept_pivot = df_csps_eei_ts_organisation_pivot.loc[is_csps_dept]
 
-df_csps_eei_ts_organisation2024_pivot = utils.filter_pivot_data(
-    df_csps_eei_ts,
-    year_filter=2024,
-    exclude_orgs=[CSPS_MEDIAN_ORGANISATION_NAME, CSPS_MEAN_ORGANISATION_NAME] + CSPS_ORGANISATION_ONLY_CONDITIONS["exclude_orgs"],
-    preserve_columns=["Organisation type"]
+# %%
+# Create cuts of the pay data we'll need (CS median x all years, organisation-level x 2025, department-level x 2025, organisation-level x all years, department-level x all years)
+# Precompute the mask components the cuts share, so each cut is a single indexing operation rather than several full-column scans
+is_summary = df_pay_cleaned["Organisation"] == PAY_SUMMARY_ORGANISATION_NAME
+is_2025 = df_pay_cleaned["Year"] == 2025
+is_excluded_org = df_pay_cleaned["Organisation"].isin(PAY_ORGANISATION_EXCLUDE_ORGS)
+is_dept = (
+    (df_pay_cleaned["Organisation type"].isin(PAY_DEPT_ONLY_CONDITIONS["organisation_type_filter"])) |
+    (df_pay_cleaned["Organisation"].isin(PAY_DEPT_ONLY_CONDITIONS["include_orgs"]))
 )
+is_excluded_dept_org = df_pay_cleaned["Organisation"].isin(PAY_DEPT_EXCLUDE_ORGS)
 
-df_csps_eei_ts_dept2024_pivot = utils.filter_pivot_data(
-    df_csps_eei_ts,
-    year_filter=2024,
-    organisation_type_filter=CSPS_DEPT_ONLY_CONDITIONS["organisation_type_filter"],
-    exclude_orgs=[CSPS_MEDIAN_ORGANISATION_NAME, CSPS_MEAN_ORGANISATION_NAME] + CSPS_DEPT_ONLY_CONDITIONS["exclude_orgs"],
-    include_orgs=CSPS_DEPT_ONLY_CONDITIONS["include_orgs"],
-    preserve_columns=["Organisation type"]
-)
+df_pay_median = df_pay_cleaned.loc[is_summary, ["Year", "Median salary"]]
 
-df_csps_eei_ts_organisation_pivot = utils.filter_pivot_data(
-    df_csps_eei_ts,
-    exclude_orgs=[CSPS_MEDIAN_ORGANISATION_NAME, CSPS_MEAN_ORGANISATION_NAME] + CSPS_ORGANISATION_ONLY_CONDITIONS["exclude_orgs"],
-    preserve_columns=["Organisation type"]
-)
+df_pay_organisation2025 = df_pay_cleaned.loc[is_2025 & ~is_summary & ~is_excluded_org]
 
-df_csps_eei_ts_dept_pivot = utils.filter_pivot_data(
-    df_csps_eei_ts,
-    organisation_type_filter=CSPS_DEPT_ONLY_CONDITIONS["organisation_type_filter"],
-    exclude_orgs=[CSPS_MEDIAN_ORGANISATION_NAME, CSPS_MEAN_ORGANISATION_NAME] + CSPS_DEPT_ONLY_CONDITIONS["exclude_orgs"],
-    include_orgs=CSPS_DEPT_ONLY_CONDITIONS["include_orgs"],
-    preserve_columns=["Organisation type"]
-)
+df_pay_organisation = df_pay_cleaned.loc[~is_summary & ~is_excluded_org]
 
-# %%
-# Create cuts of the pay data we'll need (CS median x all years, organisation-level x 2025, department-level x 2025, organisation-level x all years, department-level x all years)
-df_pay_median = df_pay_cleaned[
-    df_pay_cleaned["Organisation"] == PAY_SUMMARY_ORGANISATION_NAME
-][["Year", "Median salary"]].copy()
-
-df_pay_organisation2025 = df_pay_cleaned[
-    (df_pay_cleaned["Year"] == 2025) &
-    (df_pay_cleaned["Organisation"] != PAY_SUMMARY_ORGANISATION_NAME) &
-    (~df_pay_cleaned["Organisation"].isin(PAY_ORGANISATION_ONLY_CONDITIONS["exclude_orgs"]))
-].copy()
-
-df_pay_dept2025 = df_pay_cleaned[
-    (df_pay_cleaned["Year"] == 2025) &
-    (df_pay_cleaned["Organisation"] != PAY_SUMMARY_ORGANISATION_NAME) &
-    (
-        (df_pay_cleaned["Organisation type"].isin(PAY_DEPT_ONLY_CONDITIONS["organisation_type_filter"])) |
-        (df_pay_cleaned["Organisation"].isin(PAY_DEPT_ONLY_CONDITIONS["include_orgs"]))
-    ) &
-    (~df_pay_cleaned["Organisation"].isin(PAY_DEPT_ONLY_CONDITIONS["exclude_orgs"]))
-].copy()
-
-df_pay_organisation = df_pay_cleaned[
-    (df_pay_cleaned["Organisation"] != PAY_SUMMARY_ORGANISATION_NAME) &
-    (~df_pay_cleaned["Organisation"].isin(PAY_ORGANISATION_ONLY_CONDITIONS["exclude_orgs"]))
-].copy()
-
-df_pay_dept = df_pay_cleaned[
-    (df_pay_cleaned["Organisation"] != PAY_SUMMARY_ORGANISATION_NAME) &
-    (
-        (df_pay_cleaned["Organisation type"].isin(PAY_DEPT_ONLY_CONDITIONS["organisation_type_filter"])) |
-        (df_pay_cleaned["Organisation"].isin(PAY_DEPT_ONLY_CONDITIONS["include_orgs"]))
-    ) &
-    (~df_pay_cleaned["Organisation"].isin(PAY_DEPT_ONLY_CONDITIONS["exclude_orgs"]))
-].copy()
+# The department-level cuts are strict subsets of the organisation-level cuts, so derive them from those rather than re-scanning df_pay_cleaned
+is_dept_only = is_dept & ~is_excluded_dept_org
+
+df_pay_dept2025 = df_pay_organisation2025.loc[is_dept_only.reindex(df_pay_organisation2025.index)]
+
+df_pay_dept = df_pay_organisation.loc[is_dept_only.reindex(df_pay_organisation.index)]
+
+# Records with missing median salary, computed once here: the display cells further down show slices of these small frames rather than re-scanning the merged data
+is_missing_median = df_pay_cleaned["Median salary"].isna()
+
+df_pay_missing_median_summary = df_pay_cleaned.loc[is_missing_median & is_summary, ["Organisation", "Year"]]
+df_pay_missing_median_organisation = df_pay_cleaned.loc[is_missing_median & ~is_summary & ~is_excluded_org, ["Organisation", "Year"]]
+df_pay_missing_median_dept = df_pay_cleaned.loc[is_missing_median & ~is_summary & is_dept_only, ["Organisation", "Year"]]
 
 # %%
 # Rename organisations to facilitate merging
 for df in [df_csps_eei_ts_organisation2024_pivot, df_csps_eei_ts_dept2024_pivot, df_csps_eei_ts_organisation_pivot, df_csps_eei_ts_dept_pivot]:
-    df["Organisation"] = df["Organisation"].replace(CSPS_ORGANISATION_RENAMINGS)
+    utils.rename_organisations(df, CSPS_ORGANISATION_RENAMINGS)
 for df in [df_pay_organisation2025, df_pay_dept2025, df_pay_organisation, df_pay_dept]:
-    df["Organisation"] = df["Organisation"].replace(PAY_ORGANISATION_RENAMINGS)
+    utils.rename_organisations(df, PAY_ORGANISATION_RENAMINGS)
 
 # %%
 # Check all organisations are matched between pay and CSPS data
-csps_organisations_2024 = set(df_csps_eei_ts_organisation2024_pivot["Organisation"].unique())
-pay_organisations_2025 = set(df_pay_organisation2025["Organisation"].unique())
-csps_organisations_2024_missing = csps_organisations_2024 - pay_organisations_2025
-pay_organisations_2025_missing = pay_organisations_2025 - csps_organisations_2024
+# NB: pd.Index.difference runs in C over the unique values, avoiding Python-level string hashing
+csps_organisations_2024 = pd.Index(df_csps_eei_ts_organisation2024_pivot["Organisation"].unique())
+pay_organisations_2025 = pd.Index(df_pay_organisation2025["Organisation"].unique())
 
-assert len(csps_organisations_2024_missing) == 0, f"CSPS organisations missing from pay data: {csps_organisations_2024_missing}"
-assert len(pay_organisations_2025_missing) == 0, f"Pay organisations missing from CSPS data: {pay_organisations_2025_missing}"
+# A single symmetric_difference covers both directions in one pass; the directional breakdown in the message is only computed if the assert fires
+organisations_unmatched = csps_organisations_2024.symmetric_difference(pay_organisations_2025)
+assert len(organisations_unmatched) == 0, (
+    f"Organisations unmatched between CSPS and pay data. "
+    f"CSPS only: {list(csps_organisations_2024.difference(pay_organisations_2025))}. "
+    f"Pay only: {list(pay_organisations_2025.difference(csps_organisations_2024))}"
+)
 
 # %%
-csps_depts_2024 = set(df_csps_eei_ts_dept2024_pivot["Organisation"].unique())
-pay_depts_2025 = set(df_pay_dept2025["Organisation"].unique())
-csps_depts_2024_missing = csps_depts_2024 - pay_depts_2025
-pay_depts_2025_missing = pay_depts_2025 - csps_depts_2024
+csps_depts_2024 = pd.Index(df_csps_eei_ts_dept2024_pivot["Organisation"].unique())
+pay_depts_2025 = pd.Index(df_pay_dept2025["Organisation"].unique())
 
-assert len(csps_depts_2024_missing) == 0, f"CSPS departments missing from pay data: {csps_depts_2024_missing}"
-assert len(pay_depts_2025_missing) == 0, f"Pay departments missing from CSPS data: {pay_depts_2025_missing}"
+depts_unmatched = csps_depts_2024.symmetric_difference(pay_depts_2025)
+assert len(depts_unmatched) == 0, (
+    f"Departments unmatched between CSPS and pay data. "
+    f"CSPS only: {list(csps_depts_2024.difference(pay_depts_2025))}. "
+    f"Pay only: {list(pay_depts_2025.difference(csps_depts_2024))}"
+)
 
 # %%
 # Join CSPS and pay data, keeping only one set of organisation characteristics in organisation-level analysis
 # Adjust CSPS years to match pay years (CSPS year Y matches Pay year Y+1)
-df_pay_csps_median = df_pay_median[["Year", "Median salary"]].merge(
-    df_csps_eei_ts_median_pivot.assign(Year=df_csps_eei_ts_median_pivot["Year"] + 1),
+# NB: The CSPS pivots are indexed on their join keys first, so the joins below are indexed lookups rather than fresh hash-joins
+# NB: The year offset is applied to the pivots' Year columns in place - they aren't used again after this point - rather than via .assign(), which would copy each wide frame just to bump the join key
+df_csps_eei_ts_median_pivot["Year"] += 1
+df_csps_eei_ts_organisation_pivot["Year"] += 1
+df_csps_eei_ts_dept_pivot["Year"] += 1
+
+df_csps_median_indexed = df_csps_eei_ts_median_pivot.set_index("Year")
+df_csps_organisation2024_indexed = df_csps_eei_ts_organisation2024_pivot.set_index("Organisation")
+df_csps_dept2024_indexed = df_csps_eei_ts_dept2024_pivot.set_index("Organisation")
+df_csps_organisation_indexed = df_csps_eei_ts_organisation_pivot.set_index(["Organisation", "Year"])
+df_csps_dept_indexed = df_csps_eei_ts_dept_pivot.set_index(["Organisation", "Year"])
+
+df_pay_csps_median = df_pay_median[["Year", "Median salary"]].join(
+    df_csps_median_indexed,
     on="Year",
     how="inner"
 )
-df_pay_csps_organisation = df_pay_organisation2025[["Organisation", "Median salary"]].merge(
-    df_csps_eei_ts_organisation2024_pivot,
-    left_on="Organisation",
-    right_on="Organisation",
+df_pay_csps_organisation = df_pay_organisation2025[["Organisation", "Median salary"]].join(
+    df_csps_organisation2024_indexed,
+    on="Organisation",
     how="inner"
 )
-df_pay_csps_dept = df_pay_dept2025[["Organisation", "Median salary"]].merge(
-    df_csps_eei_ts_dept2024_pivot,
-    left_on="Organisation",
-    right_on="Organisation",
+df_pay_csps_dept = df_pay_dept2025[["Organisation", "Median salary"]].join(
+    df_csps_dept2024_indexed,
+    on="Organisation",
     how="inner"
 )
-df_pay_csps_organisation_panel = df_pay_organisation[["Organisation", "Year", "Median salary"]].merge(
-    df_csps_eei_ts_organisation_pivot.assign(Year=df_csps_eei_ts_organisation_pivot["Year"] + 1),
+df_pay_csps_organisation_panel = df_pay_organisation[["Organisation", "Year", "Median salary"]].join(
+    df_csps_organisation_indexed,
     on=["Organisation", "Year"],
     how="inner"
 )
-df_pay_csps_dept_panel = df_pay_dept[["Organisation", "Year", "Median salary"]].merge(
-    df_csps_eei_ts_dept_pivot.assign(Year=df_csps_eei_ts_dept_pivot["Year"] + 1),
+df_pay_csps_dept_panel = df_pay_dept[["Organisation", "Year", "Median salary"]].join(
+    df_csps_dept_indexed,
     on=["Organisation", "Year"],
     how="inner"
 )
 
 # %%
 # Deflate pay data
-# NB: For single-year dataframes, this only involves multiplying 'Median salary' by the relevant deflator
+# NB: Deflators are applied via a year-indexed .map() rather than merges, avoiding a merge/drop round-trip per dataframe. For single-year dataframes, this only involves multiplying 'Median salary' by the relevant deflator
 cpi_base_year = df_cpi[df_cpi["Year"] == CPI_DEFLATOR_BASE_YEAR]["CPI"].values[0]
 df_cpi["Deflator"] = cpi_base_year / df_cpi["CPI"]
-df_cpi_deflators = df_cpi[["Year", "Deflator"]]
-df_pay_csps_median = df_pay_csps_median.merge(
-    df_cpi_deflators,
-    on="Year",
-    how="left"
-)
-df_pay_csps_median["Median salary deflated"] = df_pay_csps_median["Median salary"] * df_pay_csps_median["Deflator"]
-df_pay_csps_median.drop(columns=["Deflator"], inplace=True)
+deflator_by_year = df_cpi.set_index("Year")["Deflator"]
+base_year_deflator = deflator_by_year[CPI_DEFLATOR_BASE_YEAR]
 
-df_pay_csps_organisation["Median salary deflated"] = df_pay_csps_organisation["Median salary"] * df_cpi_deflators[
-    df_cpi_deflators["Year"] == CPI_DEFLATOR_BASE_YEAR
-]["Deflator"].values[0]
+df_pay_csps_median["Median salary deflated"] = df_pay_csps_median["Median salary"] * df_pay_csps_median["Year"].map(deflator_by_year)
 
-df_pay_csps_organisation_panel = df_pay_csps_organisation_panel.merge(
-    df_cpi_deflators,
-    on="Year",
-    how="left"
-)
-df_pay_csps_organisation_panel["Median salary deflated"] = df_pay_csps_organisation_panel["Median salary"] * df_pay_csps_organisation_panel["Deflator"]
-df_pay_csps_organisation_panel.drop(columns=["Deflator"], inplace=True)
+df_pay_csps_organisation["Median salary deflated"] = df_pay_csps_organisation["Median salary"] * base_year_deflator
 
-df_pay_csps_dept["Median salary deflated"] = df_pay_csps_dept["Median salary"] * df_cpi_deflators[
-    df_cpi_deflators["Year"] == CPI_DEFLATOR_BASE_YEAR
-]["Deflator"].values[0]
+df_pay_csps_organisation_panel["Median salary deflated"] = df_pay_csps_organisation_panel["Median salary"] * df_pay_csps_organisation_panel["Year"].map(deflator_by_year)
 
-df_pay_csps_dept_panel = df_pay_csps_dept_panel.merge(
-    df_cpi_deflators,
-    on="Year",
-    how="left"
-)
-df_pay_csps_dept_panel["Median salary deflated"] = df_pay_csps_dept_panel["Median salary"] * df_pay_csps_dept_panel["Deflator"]
-df_pay_csps_dept_panel.drop(columns=["Deflator"], inplace=True)
+df_pay_csps_dept["Median salary deflated"] = df_pay_csps_dept["Median salary"] * base_year_deflator
+
+df_pay_csps_dept_panel["Median salary deflated"] = df_pay_csps_dept_panel["Median salary"] * df_pay_csps_dept_panel["Year"].map(deflator_by_year)
+
+# %%
+# Index the panel frames on entity and year once, so the fixed effects regressions below reuse the index rather than rebuilding it per call
+df_pay_csps_organisation_panel_indexed = df_pay_csps_organisation_panel.set_index(["Organisation", "Year"])
+df_pay_csps_dept_panel_indexed = df_pay_csps_dept_panel.set_index(["Organisation", "Year"])
 
 # %%
 # Plot 'Median salary deflated' over time
-sns.set_theme(style="whitegrid")
 plt = sns.lineplot(
     data=df_pay_csps_median,
     x="Year",
@@ -458,66 +497,30 @@ plt = sns.lineplot(
 # %%
 # ANALYSE DATA
 # CS median EEI scores vs median HEO/SEO pay regression, over time
-utils.draw_scatter_plot(
-    df=df_pay_csps_median,
-    x_var="Median salary deflated",
-    y_var=EEI_LABEL,
-    height=3,
-    hue="Year",
-    palette="rocket_r",
-    best_fit=True,
-    ci=None
-)
-
-utils.fit_regressions(
+results_median_eei = utils.fit_regressions(
     df_pay_csps_median, x_vars=["Median salary deflated"], y_var=EEI_LABEL, data_description="Civil service median EEI score vs median HEO/SEO pay, over time"
 )
 
 # %%
 # CS median pay and benefits theme scores vs median HEO/SEO pay regression, over time
-utils.draw_scatter_plot(
-    df=df_pay_csps_median,
-    x_var="Median salary deflated",
-    y_var="Pay and benefits",
-    height=3,
-    hue="Year",
-    palette="rocket_r",
-    best_fit=True,
-    ci=None
-)
-
-utils.fit_regressions(
+results_median_pb = utils.fit_regressions(
     df_pay_csps_median, x_vars=["Median salary deflated"], y_var="Pay and benefits", data_description="Civil service median pay and benefits score vs median HEO/SEO pay, over time"
 )
 
 # %%
 # CS median HEO/SEO pay records with missing median salary
-display(
-    df_pay_csps_median[
-        df_pay_csps_median["Median salary deflated"].isna()
-    ]
-)
+display(df_pay_missing_median_summary)
 
 # %%
 # Organisation-level EEI scores vs median HEO/SEO pay regression, for 2024 (morale data) and 2025 (pay data)
-utils.draw_scatter_plot(
-    df=df_pay_csps_organisation,
-    x_var="Median salary deflated",
-    y_var=EEI_LABEL,
-    height=3,
-    hue="Organisation type",
-    best_fit=True,
-    fit_reg=False,
-)
-
-utils.fit_regressions(
+results_organisation_eei = utils.fit_regressions(
     df_pay_csps_organisation, x_vars=["Median salary deflated"], y_var=EEI_LABEL, data_description="2024 organisation-level data"
 )
 
 # %%
 # Organisation-level EEI scores vs median HEO/SEO pay two-way fixed effects regression
 utils.fit_fixed_effects_regression(
-    df_pay_csps_organisation_panel,
+    df_pay_csps_organisation_panel_indexed,
     x_var="Median salary deflated",
     y_var=EEI_LABEL,
     entity_var="Organisation",
@@ -527,24 +530,14 @@ utils.fit_fixed_effects_regression(
 
 # %%
 # Organisation-level pay and benefits theme scores vs median HEO/SEO pay regression, for 2024 (morale data) and 2025 (pay data)
-utils.draw_scatter_plot(
-    df=df_pay_csps_organisation,
-    x_var="Median salary deflated",
-    y_var="Pay and benefits",
-    height=3,
-    hue="Organisation type",
-    best_fit=True,
-    fit_reg=False,
-)
-
-utils.fit_regressions(
+results_organisation_pb = utils.fit_regressions(
     df_pay_csps_organisation, x_vars=["Median salary deflated"], y_var="Pay and benefits", data_description="2024 organisation-level data"
 )
 
 # %%
 # Organisation-level pay and benefits theme scores vs median HEO/SEO pay two-way fixed effects regression
 utils.fit_fixed_effects_regression(
-    df_pay_csps_organisation_panel,
+    df_pay_csps_organisation_panel_indexed,
     x_var="Median salary deflated",
     y_var="Pay and benefits",
     entity_var="Organisation",
@@ -554,32 +547,18 @@ utils.fit_fixed_effects_regression(
 
 # %%
 # Organisation-level HEO/SEO pay records with missing median salary
-display(
-    df_pay_csps_organisation[
-        df_pay_csps_organisation["Median salary deflated"].isna()
-    ]
-)
+display(df_pay_missing_median_organisation[df_pay_missing_median_organisation["Year"] == 2025])
 
 # %%
 # Core department organisation-level EEI scores vs median HEO/SEO pay regression, for 2024 (morale data) and 2025 (pay data)
-utils.draw_scatter_plot(
-    df=df_pay_csps_dept,
-    x_var="Median salary deflated",
-    y_var=EEI_LABEL,
-    height=3,
-    hue="Organisation type",
-    best_fit=True,
-    fit_reg=False,
-)
-
-utils.fit_regressions(
+results_dept_eei = utils.fit_regressions(
     df_pay_csps_dept, x_vars=["Median salary deflated"], y_var=EEI_LABEL, data_description="2024 organisation-level data, depts only"
 )
 
 # %%
 # Core department organisation-level EEI scores vs median HEO/SEO pay two-way fixed effects regression
 utils.fit_fixed_effects_regression(
-    df_pay_csps_dept_panel,
+    df_pay_csps_dept_panel_indexed,
     x_var="Median salary deflated",
     y_var=EEI_LABEL,
     entity_var="Organisation",
@@ -589,24 +568,14 @@ utils.fit_fixed_effects_regression(
 
 # %%
 # Core department organisation-level pay and benefits theme scores vs median HEO/SEO pay regression, for 2024 (morale data) and 2025 (pay data)
-utils.draw_scatter_plot(
-    df=df_pay_csps_dept,
-    x_var="Median salary deflated",
-    y_var="Pay and benefits",
-    height=3,
-    hue="Organisation type",
-    best_fit=True,
-    fit_reg=False,
-)
-
-utils.fit_regressions(
+results_dept_pb = utils.fit_regressions(
     df_pay_csps_dept, x_vars=["Median salary deflated"], y_var="Pay and benefits", data_description="2024 organisation-level data, depts only"
 )
 
 # %%
 # Core department organisation-level pay and benefits theme scores vs median HEO/SEO pay two-way fixed effects regression
 utils.fit_fixed_effects_regression(
-    df_pay_csps_dept_panel,
+    df_pay_csps_dept_panel_indexed,
     x_var="Median salary deflated",
     y_var="Pay and benefits",
     entity_var="Organisation",
@@ -616,11 +585,32 @@ utils.fit_fixed_effects_regression(
 
 # %%
 # Core department organisation-level HEO/SEO pay records with missing median salary
-display(
-    df_pay_csps_dept[
-        df_pay_csps_dept["Median salary deflated"].isna()
-    ]
-)
+display(df_pay_missing_median_dept[df_pay_missing_median_dept["Year"] == 2025])
+
+# %%
+# Draw the six scatter plots as panels of a single figure, amortising figure setup across them, with best fit lines drawn from the regressions above
+scatter_specs = [
+    (df_pay_csps_median, EEI_LABEL, results_median_eei, "Year", "rocket_r", "CS median, over time"),
+    (df_pay_csps_median, "Pay and benefits", results_median_pb, "Year", "rocket_r", "CS median, over time"),
+    (df_pay_csps_organisation, EEI_LABEL, results_organisation_eei, "Organisation type", None, "Organisation-level, 2024/25"),
+    (df_pay_csps_organisation, "Pay and benefits", results_organisation_pb, "Organisation type", None, "Organisation-level, 2024/25"),
+    (df_pay_csps_dept, EEI_LABEL, results_dept_eei, "Organisation type", None, "Departments, 2024/25"),
+    (df_pay_csps_dept, "Pay and benefits", results_dept_pb, "Organisation type", None, "Departments, 2024/25"),
+]
+
+utils.draw_scatter_grid([
+    {
+        "df": df_panel,
+        "x_var": "Median salary deflated",
+        "y_var": y_var,
+        "hue": hue,
+        "palette": palette,
+        "slope": results["Median salary deflated"]["slope"],
+        "intercept": results["Median salary deflated"]["intercept"],
+        "title": title,
+    }
+    for df_panel, y_var, results, hue, palette, title in scatter_specs
+])
 
 # %%
 # Print significance legend and R² thresholds
@@ -34,14 +34,21 @@ import pandas as pd
 
 import utils
 
+# Copy-on-write means boolean-mask cuts can be taken without defensive .copy() calls: pandas only copies the data lazily, if and when a cut is actually written to
+pd.set_option("mode.copy_on_write", True)
+
 # %%
 # SET CONSTANTS
+# os.getlogin() can shell out on some platforms, so resolve it once rather than per path option
+USER_NAME = os.getlogin()
 CSPS_PATH_OPTIONS = [
-    "C:/Users/" + os.getlogin() + "/Institute for Government/Data - General/Civil service/Civil Service - People Survey/",
-    "C:/Users/" + os.getlogin() + "/OneDrive - Institute for Government/Data - Civil service/Civil Service - People Survey/"
+    "C:/Users/" + USER_NAME + "/Institute for Government/Data - General/Civil service/Civil Service - People Survey/",
+    "C:/Users/" + USER_NAME + "/OneDrive - Institute for Government/Data - Civil service/Civil Service - People Survey/"
 ]
 CSPS_FILE_NAME = "Organisation working file.xlsx"
 CSPS_SHEET = "Data.Collated"
+CSPS_USECOLS = ["Year", "Departmental group", "Organisation", "Organisation type", "Section", "Label", "Value"]
+CSPS_CATEGORY_COLUMNS = ["Organisation", "Organisation type", "Departmental group", "Section", "Label"]
 
 CSPS_MEDIAN_ORGANISATION_NAME = "Civil Service benchmark"
 CSPS_MEAN_ORGANISATION_NAME = "All employees"
@@ -76,28 +83,31 @@ CSPS_ORGS_TO_DROP = [
 ]
 
 # NB: 'Organisations' that are dropped across all the organisation-level analysis - mean and median civil service figures - are intentionally not included here
+# NB: The organisation sets are frozensets, as in analyse_pay.py, so the repeated membership tests in the checks and cut masks below are hash lookups
 CSPS_DEPT_ONLY_CONDITIONS = {
     "organisation_type_filter": ["Ministerial department"],
-    "exclude_orgs": [
+    "exclude_orgs": frozenset({
         "Attorney General's Office",
         "Export Credits Guarantee Department"
-    ],
-    "include_orgs": [
+    }),
+    "include_orgs": frozenset({
         "Department for Education group (including agencies)",
         "HM Revenue and Customs",
-    ],
+    }),
 }
 
+CSPS_SUMMARY_ORGS = frozenset({CSPS_MEDIAN_ORGANISATION_NAME, CSPS_MEAN_ORGANISATION_NAME})
+
 # %%
 # LOAD DATA
-# Try to load from each path option until one works
-for path in CSPS_PATH_OPTIONS:
-    try:
-        df_csps = pd.read_excel(path + CSPS_FILE_NAME, sheet_name=CSPS_SHEET)
-        print(f"Loaded data from {path}")
-        break
-    except FileNotFoundError:
-        print(f"File not found in {path}, trying next option...")
+# Resolve which path option exists before loading, rather than catching failed loads: this also raises a clear error when the file is in neither location, instead of leaving the dataframe unbound
+csps_path = utils.resolve_data_path(CSPS_PATH_OPTIONS, CSPS_FILE_NAME)
+csps_xlsx_path = csps_path + CSPS_FILE_NAME
+
+# NB: Parsing the workbook is the slowest step in the file, so the parsed sheet is cached to a Feather sidecar and only re-parsed when the workbook changes
+# NB: The repeated string columns are converted to categoricals as part of the load: this shrinks the frame and the cache file considerably and makes downstream filters integer comparisons rather than string comparisons
+df_csps = utils.load_excel_with_cache(csps_path, CSPS_FILE_NAME, CSPS_SHEET, usecols=CSPS_USECOLS, dtype={"Year": "int16"}, category_columns=CSPS_CATEGORY_COLUMNS)
+print(f"Loaded data from {csps_path}")
 
 
 # %%
@@ -119,71 +129,95 @@ utils.check_csps_data(
 # %%
 # EDIT DATA
 # Filter data
-df_csps_eei_ts = utils.edit_csps_data(
-    df=df_csps,
-    dept_groups_to_drop=DEPT_GROUPS_TO_DROP,
-    orgs_to_drop=CSPS_ORGS_TO_DROP
+# NB: The cleaned frame is memoised to disk, keyed on the workbook mtime and the constants the stage depends on, so reruns skip the clean when nothing has changed
+df_csps_eei_ts = utils.cache_stage(
+    "csps_eei_ts",
+    (os.path.getmtime(csps_xlsx_path), tuple(DEPT_GROUPS_TO_DROP), tuple(CSPS_ORGS_TO_DROP)),
+    lambda: utils.edit_csps_data(
+        df=df_csps,
+        dept_groups_to_drop=DEPT_GROUPS_TO_DROP,
+        orgs_to_drop=CSPS_ORGS_TO_DROP
+    )
 )
 
 # %%
 # Create cuts of the CSPS data we'll need (CS median x all years, organisation-level x 2024, department-level x 2024, organisation-level x all years, department-level x all years) and convert to wide format
-df_csps_eei_ts_median_pivot = utils.filter_pivot_data(
-    df_csps_eei_ts,
-    organisation_filter=CSPS_MEDIAN_ORGANISATION_NAME,
+# NB: The long frame is pivoted once at the widest scope - with the result memoised to disk - and each cut is sliced from the wide frame, rather than re-filtering and re-pivoting the long frame per cut
+df_csps_eei_ts_pivot = utils.cache_stage(
+    "csps_eei_ts_pivot",
+    (os.path.getmtime(csps_xlsx_path), tuple(DEPT_GROUPS_TO_DROP), tuple(CSPS_ORGS_TO_DROP)),
+    lambda: utils.filter_pivot_data(
+        df_csps_eei_ts,
+        preserve_columns=["Organisation type"]
+    )
 )
 
-df_csps_eei_ts_organisation2024_pivot = utils.filter_pivot_data(
-    df_csps_eei_ts,
-    year_filter=2024,
-    exclude_orgs=[CSPS_MEDIAN_ORGANISATION_NAME, CSPS_MEAN_ORGANISATION_NAME],
-    preserve_columns=["Organisation type"]
-)
+df_csps_eei_ts_median_pivot = df_csps_eei_ts_pivot.loc[
+    df_csps_eei_ts_pivot["Organisation"] == CSPS_MEDIAN_ORGANISATION_NAME
+].drop(columns=["Organisation", "Organisation type"]).reset_index(drop=True)
 
-df_csps_eei_ts_dept2024_pivot = utils.filter_pivot_data(
-    df_csps_eei_ts,
-    year_filter=2024,
-    organisation_type_filter=CSPS_DEPT_ONLY_CONDITIONS["organisation_type_filter"],
-    exclude_orgs=[CSPS_MEDIAN_ORGANISATION_NAME, CSPS_MEAN_ORGANISATION_NAME] + CSPS_DEPT_ONLY_CONDITIONS["exclude_orgs"],
-    include_orgs=CSPS_DEPT_ONLY_CONDITIONS["include_orgs"],
-    preserve_columns=["Organisation type"]
-)
+df_csps_eei_ts_organisation_pivot = df_csps_eei_ts_pivot.loc[
+    ~df_csps_eei_ts_pivot["Organisation"].isin(CSPS_SUMMARY_ORGS)
+].reset_index(drop=True)
 
-df_csps_eei_ts_organisation_pivot = utils.filter_pivot_data(
-    df_csps_eei_ts,
-    exclude_orgs=[CSPS_MEDIAN_ORGANISATION_NAME, CSPS_MEAN_ORGANISATION_NAME],
-    preserve_columns=["Organisation type"]
-)
+df_csps_eei_ts_organisation2024_pivot = df_csps_eei_ts_organisation_pivot.loc[
+    df_csps_eei_ts_organisation_pivot["Year"] == 2024
+].drop(columns=["Year"]).reset_index(drop=True)
 
-df_csps_eei_ts_dept_pivot = utils.filter_pivot_data(
-    df_csps_eei_ts,
-    organisation_type_filter=CSPS_DEPT_ONLY_CONDITIONS["organisation_type_filter"],
-    exclude_orgs=[CSPS_MEDIAN_ORGANISATION_NAME, CSPS_MEAN_ORGANISATION_NAME] + CSPS_DEPT_ONLY_CONDITIONS["exclude_orgs"],
-    include_orgs=CSPS_DEPT_ONLY_CONDITIONS["include_orgs"],
-    preserve_columns=["Organisation type"]
+# The department-level cuts are strict subsets of the organisation-level cut: the organisations dropped from the organisation-level analysis that are not dropped from the department-level analysis are all excluded by the organisation type filter anyway, so the two routes give the same rows
+is_csps_dept = (
+    (df_csps_eei_ts_organisation_pivot["Organisation type"].isin(CSPS_DEPT_ONLY_CONDITIONS["organisation_type_filter"])) |
+    (df_csps_eei_ts_organisation_pivot["Organisation"].isin(CSPS_DEPT_ONLY_CONDITIONS["include_orgs"]))
+) & (
+    ~df_csps_eei_ts_organisation_pivot["Organisation"].isin(CSPS_DEPT_ONLY_CONDITIONS["exclude_orgs"])
 )
+df_csps_eei_ts_dept_pivot = df_csps_eei_ts_organisation_pivot.loc[is_csps_dept].reset_index(drop=True)
+
+df_csps_eei_ts_dept2024_pivot = df_csps_eei_ts_dept_pivot.loc[
+    df_csps_eei_ts_dept_pivot["Year"] == 2024
+].drop(columns=["Year"]).reset_index(drop=True)
 
 # %%
 # ANALYSE DATA
-# CS median EEI and theme scores regression over time
-utils.draw_1d_pairplot(df_csps_eei_ts_median_pivot, x_vars=TS_LABELS, y_var=EEI_LABEL, hue="Year", palette="rocket_r")
+# EEI and theme scores regressions for all three cross-sectional cuts
+# The cuts are stacked into one long frame with a Cut label and fitted in a single groupby pass, rather than three separate invocations each running the pandas machinery from cold. Regressions are fitted before plotting so the pairplots can reuse their slopes and intercepts, rather than seaborn refitting the same regression per subplot
+df_regression_cuts = pd.concat(
+    [
+        df_csps_eei_ts_median_pivot.assign(Cut="Civil service median data over time"),
+        df_csps_eei_ts_organisation2024_pivot.assign(Cut="2024 organisation-level data"),
+        df_csps_eei_ts_dept2024_pivot.assign(Cut="2024 organisation-level data, depts only"),
+    ],
+    ignore_index=True
+)
+
+regression_results = {
+    cut: utils.fit_regressions(df_cut, x_vars=TS_LABELS, y_var=EEI_LABEL, data_description=cut)
+    for cut, df_cut in df_regression_cuts.groupby("Cut", sort=False)
+}
 
-utils.fit_regressions(
-    df_csps_eei_ts_median_pivot, x_vars=TS_LABELS, y_var=EEI_LABEL, data_description="Civil service median data over time"
+# %%
+# CS median EEI and theme scores regression over time
+utils.draw_1d_pairplot(
+    df_csps_eei_ts_median_pivot, x_vars=TS_LABELS, y_var=EEI_LABEL, hue="Year", palette="rocket_r",
+    results=regression_results["Civil service median data over time"]
 )
 
 # %%
 # Organisation-level EEI and theme scores regression for 2024
-utils.draw_1d_pairplot(df_csps_eei_ts_organisation2024_pivot, x_vars=TS_LABELS, y_var=EEI_LABEL, hue="Organisation type")
-
-utils.fit_regressions(
-    df_csps_eei_ts_organisation2024_pivot, x_vars=TS_LABELS, y_var=EEI_LABEL, data_description="2024 organisation-level data"
+utils.draw_1d_pairplot(
+    df_csps_eei_ts_organisation2024_pivot, x_vars=TS_LABELS, y_var=EEI_LABEL, hue="Organisation type",
+    results=regression_results["2024 organisation-level data"]
 )
 
 # %%
 # Organisation-level EEI scores vs theme score two-way fixed effects regressions
+# NB: The panel frames are indexed on entity and year once outside the loops, so each of the nine fits reuses the index rather than re-factorising Organisation and Year per call
+df_csps_eei_ts_organisation_panel_indexed = df_csps_eei_ts_organisation_pivot.set_index(["Organisation", "Year"])
+df_csps_eei_ts_dept_panel_indexed = df_csps_eei_ts_dept_pivot.set_index(["Organisation", "Year"])
+
 for theme_score in TS_LABELS:
     utils.fit_fixed_effects_regression(
-        df_csps_eei_ts_organisation_pivot,
+        df_csps_eei_ts_organisation_panel_indexed,
         x_var=theme_score,
         y_var=EEI_LABEL,
         entity_var="Organisation",
@@ -193,17 +227,16 @@ for theme_score in TS_LABELS:
 
 # %%
 # Organisation-level EEI and theme scores for departments regression for 2024
-utils.draw_1d_pairplot(df_csps_eei_ts_dept2024_pivot, x_vars=TS_LABELS, y_var=EEI_LABEL, hue="Organisation type")
-
-utils.fit_regressions(
-    df_csps_eei_ts_dept2024_pivot, x_vars=TS_LABELS, y_var=EEI_LABEL, data_description="2024 organisation-level data, depts only"
+utils.draw_1d_pairplot(
+    df_csps_eei_ts_dept2024_pivot, x_vars=TS_LABELS, y_var=EEI_LABEL, hue="Organisation type",
+    results=regression_results["2024 organisation-level data, depts only"]
 )
 
 # %%
 # Organisation-level EEI scores vs theme score two-way fixed effects regressions for departments
 for theme_score in TS_LABELS:
     utils.fit_fixed_effects_regression(
-        df_csps_eei_ts_dept_pivot,
+        df_csps_eei_ts_dept_panel_indexed,
         x_var=theme_score,
         y_var=EEI_LABEL,
         entity_var="Organisation",